@@ -7,6 +7,7 @@ from tests.test_utils.test_utils import (
     _test_group32,
     _test_hash_addr,
     _test_oracle,
+    _test_push32,
     _test_root,
     mock_env,
 )
@@ -17,7 +18,7 @@ from traces_parser.parser.environment.parsing_environment import (
 from traces_parser.parser.information_flow.constant_step_indexes import (
     SPECIAL_STEP_INDEXES,
 )
-from traces_parser.parser.instructions.instruction import Instruction
+from traces_parser.parser.instructions.instruction import Instruction, format_many
 from traces_parser.parser.instructions.instructions import (
     ADD,
     ADDMOD,
@@ -333,6 +334,47 @@ def test_instruction_opcode_matches_class():
     for opcode, cls in _opcodes_to_instruction:
         assert get_instruction_class(opcode) == cls
         assert cls.opcode == opcode
+    assert get_instruction_class(0xEF) is None
+    assert get_instruction_class(256) is None
+    assert get_instruction_class(-1) is None
+
+
+def test_generated_instruction_class_module():
+    assert ADD.__module__ == "traces_parser.parser.instructions.instructions"
+    assert ADD.__qualname__ == "ADD"
+    assert repr(ADD) == "<class 'traces_parser.parser.instructions.instructions.ADD'>"
+
+
+def test_instruction_name_from_opcode():
+    call = _test_parse_instruction(
+        CALL,
+        mock_env(stack_contents=["0x0" for _ in range(7)], memory_content=""),
+        _test_oracle(),
+    )
+    unknown = Instruction(0xEF, 1, 0, _test_root(), call.flow)
+
+    assert call.name == "CALL"
+    assert unknown.name == "UNKNOWN"
+
+
+def test_instruction_format_many():
+    root = _test_root()
+    instructions = [
+        _test_push32("0x1", pc=1, step_index=0, call_context=root),
+        _test_push32("0x2", pc=2, step_index=1, call_context=root),
+    ]
+
+    assert repr(instructions[0]) == str(instructions[0])
+    assert format_many(instructions) == "\n".join(str(i) for i in instructions)
+    assert format_many([]) == ""
+
+
+def test_instruction_subclass_binds_flow_spec():
+    class CustomInstruction(Instruction):
+        __slots__ = ()
+        flow_spec = ADD.flow_spec
+
+    assert CustomInstruction.flow_spec_compute == ADD.flow_spec.compute_flow
 
 
 InstructionType = TypeVar("InstructionType", bound=Instruction)
@@ -425,8 +467,9 @@ def test_simple_stack_instructions() -> None:
 
         instr = _test_parse_instruction(instr_type, env, oracle)
 
-        accesses = instr.get_accesses()
-        writes = instr.get_writes()
+        accesses, writes = instr.flow
+        assert accesses == instr.get_accesses()
+        assert writes == instr.get_writes()
         assert len(accesses.stack) == stack_inputs_n
         assert len(writes.stack_pops) == stack_inputs_n
         for i in range(stack_inputs_n):
@@ -37,6 +37,14 @@ def test_stack_push_all():
     assert stack.peek(1).get_hexstring() == HexString("5678").as_size(32)
 
 
+def test_stack_push_all_with_wrong_size():
+    stack = Stack()
+
+    with pytest.raises(Exception):
+        stack.push_all([_test_group32("1234"), _test_group("5678")])
+    assert stack.size() == 0
+
+
 def test_stack_set():
     stack = _test_stack(["0x1", "0x2", "0x3", "0x4"])
 
@@ -73,6 +81,18 @@ def test_stack_get_all():
     assert result[2].get_hexstring() == HexString("3").as_size(32)
 
 
+def test_stack_get_all_hexstrings():
+    stack = _test_stack(["1", "2", "3"])
+
+    result = stack.get_all_hexstrings()
+
+    assert result == [
+        HexString("1").as_size(32),
+        HexString("2").as_size(32),
+        HexString("3").as_size(32),
+    ]
+
+
 def test_stack_clear():
     stack = _test_stack(["1", "2"])
 
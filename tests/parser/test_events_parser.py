@@ -1,4 +1,4 @@
-from traces_parser.parser.events_parser import parse_events
+from traces_parser.parser.events_parser import _stack_value, parse_events
 from traces_parser.datatypes.hexstring import HexString
 
 
@@ -39,3 +39,8 @@ def test_events_parser():
         == "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000080"
     )
     assert events[3].depth == 1
+
+
+def test_events_parser_stack_value():
+    for value in ["0x0", "0xABC", "0x" + "f" * 64, "0x1" + "2" * 64, "0x12" + "3" * 64]:
+        assert _stack_value(value) == HexString(value).as_size(32)
@@ -106,6 +106,8 @@ def test_parser_builds_call_tree() -> None:
     assert result.call_tree.call_context.code_address == _test_hash_addr("0xto")
     assert len(result.call_tree.children) == 1
     assert result.call_tree.children[0].call_context.code_address == call_target
+    call = result.call_tree.children[0].call_context.initiating_instruction
+    assert call is result.instructions[len(pushes)]
 
 
 def test_parser_sets_step_indexes():
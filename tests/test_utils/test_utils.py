@@ -37,7 +37,6 @@ from traces_parser.parser.storage.storage_writes import (
 )
 from traces_parser.parser.trace_evm.trace_evm import InstructionMetadata
 from traces_parser.datatypes.hexstring import HexString
-from traces_parser.utils.mnemonics import opcode_to_name
 
 TestVal = str | HexString | StorageByteGroup
 
@@ -325,7 +324,6 @@ def _test_instruction(
 
     return instruction_type(
         instruction_type.opcode,
-        opcode_to_name(instruction_type.opcode, "UKNOWN") or "UNKNOWN",
         pc,
         step_index,
         call_context,
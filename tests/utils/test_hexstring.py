@@ -41,6 +41,15 @@ def test_hexstring_slice():
     assert "bc" == HexString("abcd")[1:3]
 
 
+def test_hexstring_byte_slice():
+    hexstring = HexString("abcdef01")
+
+    assert "cdef" == hexstring.byte_slice(1, 3)
+    assert hexstring[2:6] == hexstring.byte_slice(1, 3)
+    assert "ef01" == hexstring.byte_slice(2, 10)
+    assert isinstance(hexstring.byte_slice(0, 1), HexString)
+
+
 def test_hexstring_last_bytes():
     assert "efgh" == HexString("abcdefgh").as_size(2)
 
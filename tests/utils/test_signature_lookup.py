@@ -0,0 +1,34 @@
+from traces_parser.datatypes.hexstring import HexString
+from traces_parser.utils.signatures.signature_lookup import (
+    CachedSignatureLookup,
+    SignatureLookup,
+)
+
+
+class _CountingLookup(SignatureLookup):
+    def __init__(self, signatures: dict[str, str]) -> None:
+        self.signatures = signatures
+        self.lookups = 0
+
+    def lookup_by_hex(self, signature_hex: HexString) -> str | None:
+        self.lookups += 1
+        return self.signatures.get(signature_hex.without_prefix())
+
+
+def test_cached_signature_lookup_caches_found_signatures():
+    lookup = _CountingLookup({"a9059cbb": "transfer(address,uint256)"})
+    cached = CachedSignatureLookup(lookup)
+
+    assert cached.lookup_by_hex(HexString("0xa9059cbb")) == "transfer(address,uint256)"
+    assert cached.lookup_by_hex(HexString("a9059cbb")) == "transfer(address,uint256)"
+    assert lookup.lookups == 1
+
+
+def test_cached_signature_lookup_retries_missing_signatures():
+    lookup = _CountingLookup({})
+    cached = CachedSignatureLookup(lookup)
+
+    assert cached.lookup_by_hex(HexString("0x12345678")) is None
+    lookup.signatures["12345678"] = "found()"
+    assert cached.lookup_by_hex(HexString("0x12345678")) == "found()"
+    assert lookup.lookups == 2
@@ -29,6 +29,13 @@ class HexString(UserString):
             return self[0:0]
         return self[-2 * n :].rjust(2 * n, "0")
 
+    def byte_slice(self, start: int, stop: int) -> "HexString":
+        """Bytes from start to stop, same as self[start * 2 : stop * 2]
+        but without normalizing the already normalized slice again"""
+        hexstring = HexString.__new__(HexString)
+        hexstring.data = self.data[start * 2 : stop * 2]
+        return hexstring
+
     def size(self) -> int:
         """Size in bytes"""
         return len(self) // 2
@@ -40,7 +40,7 @@ class StorageByteGroup:
                 self._step_indexes = self._step_indexes[:size]
             else:
                 self._hexstring = self._hexstring + HexString.zeros(size - own_len)
-                self._step_indexes.extend([step_index for _ in range(size - own_len)])
+                self._step_indexes.extend([step_index] * (size - own_len))
                 print(self)
 
     def depends_on_instruction_indexes(self) -> set[int]:
@@ -64,9 +64,7 @@ class StorageByteGroup:
 
     @staticmethod
     def from_hexstring(hexstring: HexString, creation_step_index: int):
-        return StorageByteGroup(
-            hexstring, [creation_step_index for _ in range(hexstring.size())]
-        )
+        return StorageByteGroup(hexstring, [creation_step_index] * hexstring.size())
 
     def clone(self) -> "StorageByteGroup":
         return StorageByteGroup(self._hexstring, list(self._step_indexes))
@@ -80,7 +78,7 @@ class StorageByteGroup:
         start, stop = slice_to_start_stop(index, len(self))
         if isinstance(index.step, int):
             raise NotImplementedError()
-        hexstring_slice = self._hexstring[start * 2 : stop * 2]
+        hexstring_slice = self._hexstring.byte_slice(start, stop)
         step_indexes_slice = self._step_indexes[start:stop]
         return StorageByteGroup(hexstring_slice, step_indexes_slice)
 
@@ -13,12 +13,13 @@ from traces_parser.parser.instructions.instructions import (
     CallContextEnteringInstruction,
 )
 from traces_parser.utils.mnemonics import opcode_to_name
+from traces_parser.utils.signatures.signature_lookup import CachedSignatureLookup
 from traces_parser.utils.signatures.signature_registry import SignatureRegistry
 
 # TODO: rename and/or split this file
 
 # TODO: do not use a global signature registry
-signature_lookup = SignatureRegistry("http://localhost:8000")
+signature_lookup = CachedSignatureLookup(SignatureRegistry("http://localhost:8000"))
 
 
 @dataclass
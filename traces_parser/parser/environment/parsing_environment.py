@@ -26,58 +26,73 @@ class ParsingEnvironment:
         self._transient_storage = RevertableStorage(AddressKeyStorage())
         self._persistent_storage = RevertableStorage(AddressKeyStorage())
         self._last_executed_sub_context = LastExecutedSubContextStorage()
+        # every storage handles all call events (enter, exit and revert)
+        self._storages: tuple[Storage, ...] = (
+            self._last_executed_sub_context,
+            self._stack_storage,
+            self._memory_storage,
+            self._balances_storage,
+            self._persistent_storage,
+            self._transient_storage,
+        )
+        self._update_current_storages()
 
     def on_call_enter(self, next_call_context: CallContext):
-        for storage in self._storages():
+        for storage in self._storages:
             storage.on_call_enter(self.current_call_context, next_call_context)
         self.current_call_context = next_call_context
+        self._update_current_storages()
 
     def on_call_exit(self, next_call_context: CallContext):
-        for storage in self._storages():
+        for storage in self._storages:
             storage.on_call_exit(self.current_call_context, next_call_context)
         self.current_call_context = next_call_context
+        self._update_current_storages()
 
     def on_revert(self, next_call_context: CallContext):
-        for storage in self._storages():
+        for storage in self._storages:
             storage.on_revert(self.current_call_context, next_call_context)
         self.current_call_context = next_call_context
-
-    def _storages(self) -> list[Storage]:
-        return [
-            self._last_executed_sub_context,
-            self._stack_storage,
-            self._memory_storage,
-            self._balances_storage,
-            self._persistent_storage,
-            self._transient_storage,
-        ]
+        self._update_current_storages()
+
+    def _update_current_storages(self):
+        # the current storages only change on call context changes,
+        # so we cache them instead of looking them up on every access
+        self._current_stack = self._stack_storage.current()
+        self._current_memory = self._memory_storage.current()
+        self._current_balances = self._balances_storage.current()
+        self._current_transient_storage = self._transient_storage.current()
+        self._current_persistent_storage = self._persistent_storage.current()
+        self._current_last_executed_sub_context = (
+            self._last_executed_sub_context.current()
+        )
 
     @property
     def stack(self) -> Stack:
-        return self._stack_storage.current()
+        return self._current_stack
 
     @property
     def memory(self) -> Memory:
-        return self._memory_storage.current()
+        return self._current_memory
 
     @property
     def balances(self) -> Balances:
-        return self._balances_storage.current()
+        return self._current_balances
 
     @property
     def transient_storage(self) -> AddressKeyStorage:
-        return self._transient_storage.current()
+        return self._current_transient_storage
 
     @property
     def persistent_storage(self) -> AddressKeyStorage:
-        return self._persistent_storage.current()
+        return self._current_persistent_storage
 
     @property
     def last_executed_sub_context(self) -> CallContext | None:
-        return self._last_executed_sub_context.current()
+        return self._current_last_executed_sub_context
 
 
-@dataclass
+@dataclass(slots=True)
 class InstructionOutputOracle:
     """Output data we know from the trace. Oracle, because we can peek one step into the future with this"""
 
@@ -5,12 +5,12 @@ from dataclasses import dataclass
 from traces_parser.datatypes.hexstring import HexString
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceEvent:
     pc: int
     op: int
     stack: list[HexString]
-    depth: int
+    depth: int | None
     memory: HexString | None = None
 
 
@@ -25,7 +25,12 @@ def parse_events(lines: Iterable[str]) -> Iterable[TraceEvent]:
         yield TraceEvent(
             pc=obj["pc"],
             op=obj["op"],
-            stack=[HexString(val).as_size(32) for val in reversed(obj["stack"])],
+            stack=[_stack_value(val) for val in reversed(obj["stack"])],
             memory=memory,
             depth=obj["depth"],
         )
+
+
+def _stack_value(value: str) -> HexString:
+    """Same as HexString(value).as_size(32), but creates a single HexString"""
+    return HexString(value.removeprefix("0x").lower()[-64:].rjust(64, "0"))
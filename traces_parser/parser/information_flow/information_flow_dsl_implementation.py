@@ -1,5 +1,4 @@
 from abc import abstractmethod
-from dataclasses import dataclass
 from functools import wraps
 from typing import Callable
 
@@ -10,7 +9,12 @@ from traces_parser.parser.environment.parsing_environment import (
 from traces_parser.parser.information_flow.constant_step_indexes import (
     SPECIAL_STEP_INDEXES,
 )
-from traces_parser.parser.information_flow.information_flow_spec import Flow, FlowSpec
+from traces_parser.parser.information_flow.information_flow_spec import (
+    _EMPTY_FLOW,
+    Flow,
+    FlowSpec,
+    FlowWithResult,
+)
 from traces_parser.datatypes.storage_byte_group import StorageByteGroup
 from traces_parser.parser.storage.storage_writes import (
     BalanceAccess,
@@ -37,30 +41,58 @@ from traces_parser.parser.storage.storage_writes import (
 from traces_parser.datatypes.hexstring import HexString
 
 
-@dataclass(frozen=True)
-class FlowWithResult(Flow):
-    result: StorageByteGroup
+def noop_compute(
+    env: ParsingEnvironment, output_oracle: InstructionOutputOracle
+) -> Flow:
+    return _EMPTY_FLOW
 
 
 class NoopNode(FlowSpec):
     def compute(
         self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
     ) -> Flow:
-        return Flow(
-            accesses=StorageAccesses(),
-            writes=StorageWrites(),
-        )
+        return _EMPTY_FLOW
+
+    # a noop has no result to leave out
+    compute_flow = compute
 
 
 class FlowNode(FlowSpec):
+    """Node of a flow spec tree.
+
+    The accesses and writes of all nodes in a tree are collected in evaluation
+    order and merged once in compute, instead of merging them at every node.
+    """
+
     def __init__(self, arguments: tuple["FlowNodeWithResult", ...]) -> None:
         super().__init__()
         self.arguments = arguments
 
-    @abstractmethod
     def compute(
         self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
+    ) -> Flow | FlowWithResult:
+        return self.compute_flow(env, output_oracle)
+
+    def compute_flow(
+        self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
     ) -> Flow:
+        accesses: list[StorageAccesses] = []
+        writes: list[StorageWrites] = []
+        self._collect(env, output_oracle, accesses, writes)
+        return Flow(
+            accesses=StorageAccesses.merge(accesses),
+            writes=StorageWrites.merge(writes),
+        )
+
+    @abstractmethod
+    def _collect(
+        self,
+        env: ParsingEnvironment,
+        output_oracle: InstructionOutputOracle,
+        accesses: list[StorageAccesses],
+        writes: list[StorageWrites],
+    ) -> FlowWithResult | None:
+        """Compute the node and its arguments, appending their accesses and writes"""
         pass
 
 
@@ -68,19 +100,35 @@ class FlowNodeWithResult(FlowNode):
     def compute(
         self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
     ) -> FlowWithResult:
-        args = tuple(arg.compute(env, output_oracle) for arg in self.arguments)
-
-        flow_step = self._get_result(args, env, output_oracle)
-
-        accesses = [arg.accesses for arg in args] + [flow_step.accesses]
-        writes = [arg.writes for arg in args] + [flow_step.writes]
-
+        accesses: list[StorageAccesses] = []
+        writes: list[StorageWrites] = []
+        flow_step = self._collect(env, output_oracle, accesses, writes)
         return FlowWithResult(
             accesses=StorageAccesses.merge(accesses),
             writes=StorageWrites.merge(writes),
             result=flow_step.result,
         )
 
+    def _collect(
+        self,
+        env: ParsingEnvironment,
+        output_oracle: InstructionOutputOracle,
+        accesses: list[StorageAccesses],
+        writes: list[StorageWrites],
+    ) -> FlowWithResult:
+        # the arguments only contain the accesses and writes of their own step,
+        # which is fine as the callbacks only use their results
+        args = tuple(
+            [
+                arg._collect(env, output_oracle, accesses, writes)
+                for arg in self.arguments
+            ]
+        )
+        flow_step = self._get_result(args, env, output_oracle)
+        accesses.append(flow_step.accesses)
+        writes.append(flow_step.writes)
+        return flow_step
+
     @abstractmethod
     def _get_result(
         self,
@@ -92,20 +140,20 @@ class FlowNodeWithResult(FlowNode):
 
 
 class WritingFlowNode(FlowNode):
-    def compute(
-        self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
-    ) -> Flow:
-        args = tuple(arg.compute(env, output_oracle) for arg in self.arguments)
-
-        flow_writes = self._get_writes(args, env, output_oracle)
-
-        accesses = [arg.accesses for arg in args]
-        writes = [arg.writes for arg in args] + [flow_writes]
-
-        return Flow(
-            accesses=StorageAccesses.merge(accesses),
-            writes=StorageWrites.merge(writes),
+    def _collect(
+        self,
+        env: ParsingEnvironment,
+        output_oracle: InstructionOutputOracle,
+        accesses: list[StorageAccesses],
+        writes: list[StorageWrites],
+    ) -> None:
+        args = tuple(
+            [
+                arg._collect(env, output_oracle, accesses, writes)
+                for arg in self.arguments
+            ]
         )
+        writes.append(self._get_writes(args, env, output_oracle))
 
     @abstractmethod
     def _get_writes(
@@ -122,6 +170,26 @@ class ConstNode(FlowNodeWithResult):
         super().__init__(())
         self.hexstring = hexstring
 
+    def compute(
+        self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
+    ) -> FlowWithResult:
+        # no arguments and nothing accessed or written, thus nothing to merge
+        return self._get_result((), env, output_oracle)
+
+    def compute_flow(
+        self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
+    ) -> Flow:
+        return _EMPTY_FLOW
+
+    def _collect(
+        self,
+        env: ParsingEnvironment,
+        output_oracle: InstructionOutputOracle,
+        accesses: list[StorageAccesses],
+        writes: list[StorageWrites],
+    ) -> FlowWithResult:
+        return self._get_result((), env, output_oracle)
+
     def _get_result(
         self,
         args: tuple[FlowWithResult, ...],
@@ -129,8 +197,8 @@ class ConstNode(FlowNodeWithResult):
         output_oracle: InstructionOutputOracle,
     ) -> FlowWithResult:
         return FlowWithResult(
-            accesses=StorageAccesses(),
-            writes=StorageWrites(),
+            accesses=_EMPTY_FLOW.accesses,
+            writes=_EMPTY_FLOW.writes,
             result=StorageByteGroup.from_hexstring(
                 self.hexstring, env.current_step_index
             ),
@@ -145,13 +213,18 @@ class CombineNode(FlowSpec):
     def compute(
         self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
     ) -> Flow:
-        args = tuple(arg.compute(env, output_oracle) for arg in self.arguments)
-
+        accesses: list[StorageAccesses] = []
+        writes: list[StorageWrites] = []
+        for arg in self.arguments:
+            arg._collect(env, output_oracle, accesses, writes)
         return Flow(
-            accesses=StorageAccesses.merge([arg.accesses for arg in args]),
-            writes=StorageWrites.merge([arg.writes for arg in args]),
+            accesses=StorageAccesses.merge(accesses),
+            writes=StorageWrites.merge(writes),
         )
 
+    # the results of the arguments are never part of a combined flow
+    compute_flow = compute
+
 
 class CallbackNodeWithResult(FlowNodeWithResult):
     def __init__(
@@ -322,7 +395,7 @@ def _oracle_mem_range_peek_node(
 ):
     offset = args[0].result.get_hexstring().as_int()
     size = args[1].result.get_hexstring().as_int()
-    data = output_oracle.memory[offset * 2 : offset * 2 + size * 2]
+    data = output_oracle.memory.byte_slice(offset, offset + size)
     result = StorageByteGroup.from_hexstring(data, env.current_step_index)
     if len(result) < size:
         padding = HexString.zeros(size - len(result))
@@ -1,6 +1,6 @@
-from abc import abstractmethod
-from dataclasses import dataclass
+from typing import NamedTuple, Protocol
 
+from traces_parser.datatypes.storage_byte_group import StorageByteGroup
 from traces_parser.parser.environment.parsing_environment import (
     InstructionOutputOracle,
     ParsingEnvironment,
@@ -8,16 +8,32 @@ from traces_parser.parser.environment.parsing_environment import (
 from traces_parser.parser.storage.storage_writes import StorageAccesses, StorageWrites
 
 
-@dataclass(frozen=True)
-class Flow:
+class Flow(NamedTuple):
     accesses: StorageAccesses
     writes: StorageWrites
 
 
-class FlowSpec:
-    @abstractmethod
+class FlowWithResult(NamedTuple):
+    """Flow of a node together with the value it evaluates to"""
+
+    accesses: StorageAccesses
+    writes: StorageWrites
+    result: StorageByteGroup
+
+
+# shared by all noop flows, the empty accesses and writes only hold tuples
+_EMPTY_FLOW = Flow(accesses=StorageAccesses(), writes=StorageWrites())
+
+
+class FlowSpec(Protocol):
     def compute(
         self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
-    ) -> Flow:
+    ) -> Flow | FlowWithResult:
         """Compute the output of an information flow for a specific environment"""
-        pass
+        ...
+
+    def compute_flow(
+        self, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
+    ) -> Flow:
+        """Same as compute, but without the result of specs that evaluate to a value"""
+        ...
@@ -1,5 +1,6 @@
+from abc import ABCMeta
 from dataclasses import dataclass, field
-from typing import ClassVar
+from typing import Callable, ClassVar, Iterable
 
 
 from traces_parser.parser.environment.call_context import CallContext
@@ -10,19 +11,41 @@ from traces_parser.parser.environment.parsing_environment import (
 from traces_parser.parser.information_flow.information_flow_dsl import FlowSpec, noop
 from traces_parser.parser.information_flow.information_flow_dsl_implementation import (
     Flow,
+    noop_compute,
 )
 from traces_parser.parser.storage.storage_writes import StorageAccesses, StorageWrites
+from traces_parser.utils.mnemonics import OPCODE_NAMES
 
 
-@dataclass(frozen=True, repr=False, eq=False)
-class Instruction:
+class _InstructionMeta(ABCMeta):
+    # set on instruction classes when registering them
+    _class_opcode: int
+
+    @property
+    def opcode(cls) -> int:
+        """The opcode an instruction class is registered for (eg CALL.opcode).
+        Instances read their own opcode slot instead."""
+        return cls._class_opcode
+
+
+@dataclass(frozen=True, repr=False, eq=False, slots=True)
+class Instruction(metaclass=_InstructionMeta):
     opcode: int
-    name: str
     program_counter: int
     step_index: int
     call_context: CallContext = field(compare=False, hash=False)
     flow: Flow
     flow_spec: ClassVar[FlowSpec] = noop()
+    # flow_spec.compute_flow resolved once per class, see __init_subclass__
+    flow_spec_compute: ClassVar[
+        Callable[[ParsingEnvironment, InstructionOutputOracle], Flow]
+    ] = staticmethod(noop_compute)
+    # the opcode an instruction class is registered for, see _InstructionMeta
+    _class_opcode: ClassVar[int]
+
+    @property
+    def name(self) -> str:
+        return OPCODE_NAMES[self.opcode] or "UNKNOWN"
 
     def get_accesses(self) -> StorageAccesses:
         return self.flow.accesses
@@ -34,7 +57,14 @@ class Instruction:
     def parse_flow(
         cls, env: ParsingEnvironment, output_oracle: InstructionOutputOracle
     ) -> Flow:
-        return cls.flow_spec.compute(env, output_oracle)
+        return cls.flow_spec_compute(env, output_oracle)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # no zero-argument super(), as slots=True replaces the class
+        super(Instruction, cls).__init_subclass__(**kwargs)
+        # cache the compute function of flow_spec, which is called for every parsed instruction.
+        # compute_flow leaves out the result of specs like POP, an instruction flow has none
+        cls.flow_spec_compute = staticmethod(cls.flow_spec.compute_flow)
 
     def __eq__(self, other) -> bool:
         return (
@@ -47,5 +77,9 @@ class Instruction:
     def __str__(self) -> str:
         return f"<{self.name}@{self.call_context.code_address}:{self.program_counter}#{self.step_index}>"
 
-    def __repr__(self) -> str:
-        return self.__str__()
+    __repr__ = __str__
+
+
+def format_many(instructions: Iterable[Instruction]) -> str:
+    """One instruction per line"""
+    return "\n".join(map(Instruction.__str__, instructions))
@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from itertools import chain, pairwise
 from typing import Sequence
 
 from traces_parser.parser.environment.call_context import CallContext
@@ -52,39 +53,32 @@ def _create_root_call_context(
     )
 
 
+# follows the last event, without a depth as there is no further output to compare to
+_END_OF_TRACE = TraceEvent(pc=0, op=0, stack=[], depth=None)
+
+
 def _parse_instructions(
     events: Iterable[TraceEvent], root_call_context: CallContext, verify_storages: bool
 ) -> Sequence[Instruction]:
     tracer_evm = TraceEVM(ParsingEnvironment(root_call_context), verify_storages)
-    events_iterator = events.__iter__()
-    try:
-        current_event = next(events_iterator)
-    except StopIteration:
-        # no events to parse
-        return []
+    instructions: list[Instruction] = []
 
-    instructions = []
-    for next_event in events_iterator:
-        instructions.append(
-            tracer_evm.step(
+    # bind once, as they are used for every event
+    step = tracer_evm.step
+    append = instructions.append
+    empty_memory = HexString("")
+    # pair each event with its successor, whose stack and memory are the output of the event
+    for current_event, next_event in pairwise(chain(events, (_END_OF_TRACE,))):
+        append(
+            step(
                 instruction_metadata=InstructionMetadata(
                     current_event.op, current_event.pc
                 ),
                 output_oracle=InstructionOutputOracle(
                     next_event.stack,
-                    next_event.memory or HexString(""),
+                    next_event.memory or empty_memory,
                     next_event.depth,
                 ),
             )
         )
-        current_event = next_event
-
-    instructions.append(
-        tracer_evm.step(
-            instruction_metadata=InstructionMetadata(
-                current_event.op, current_event.pc
-            ),
-            output_oracle=InstructionOutputOracle([], HexString(""), None),
-        )
-    )
     return instructions
@@ -1,13 +1,12 @@
 from typing import Sequence
 
-from traces_parser.parser.information_flow.constant_step_indexes import (
-    SPECIAL_STEP_INDEXES,
-)
 from traces_parser.datatypes.storage_byte_group import StorageByteGroup
 from traces_parser.datatypes.hexstring import HexString
 
 
 class Stack:
+    __slots__ = ("_stack",)
+
     def __init__(self) -> None:
         self._stack: list[StorageByteGroup] = []
 
@@ -19,26 +18,26 @@ class Stack:
         """Push a single value to the top of the stack"""
         if len(value) < 32:
             raise Exception(f"Invalid size for stack push: {len(value)}")
-            padding = StorageByteGroup.from_hexstring(
-                HexString.zeros(32 - len(value)),
-                SPECIAL_STEP_INDEXES.DEPRECATED,
-            )
-            value = padding + value
         self._stack.append(value)
 
     def push_all(self, values: Sequence[StorageByteGroup]):
         """Push multiple values. First one will be on top of the stack"""
-        for value in reversed(values):
-            self.push(value)
+        for value in values:
+            if len(value) < 32:
+                raise Exception(f"Invalid size for stack push: {len(value)}")
+        self._stack.extend(reversed(values))
 
     def get_all(self) -> Sequence[StorageByteGroup]:
         """Get all values. First one will be the top of the stack"""
-        return [self.peek(i) for i in range(self.size())]
+        return self._stack[::-1]
+
+    def get_all_hexstrings(self) -> Sequence[HexString]:
+        """Get the hexstrings of all values, without their step indexes.
+        First one will be the top of the stack"""
+        return [value.get_hexstring() for value in reversed(self._stack)]
 
     def pop(self) -> StorageByteGroup:
-        result = self.peek(0)
-        self._stack.pop()
-        return result
+        return self._stack.pop()
 
     def set(self, index: int, value: StorageByteGroup):
         if len(value) != 32:
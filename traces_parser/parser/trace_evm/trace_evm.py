@@ -14,8 +14,8 @@ from traces_parser.parser.environment.parsing_environment import (
 from traces_parser.parser.information_flow.information_flow_spec import Flow
 from traces_parser.parser.instructions.instruction import Instruction
 from traces_parser.parser.instructions.instructions import (
+    _INSTRUCTIONS_TABLE,
     CallInstruction,
-    get_instruction_class,
 )
 from traces_parser.datatypes.storage_byte_group import StorageByteGroup
 from traces_parser.parser.storage.storage_writes import (
@@ -27,7 +27,7 @@ from traces_parser.datatypes.hexstring import HexString
 from traces_parser.utils.mnemonics import opcode_to_name
 
 
-@dataclass
+@dataclass(slots=True)
 class InstructionMetadata:
     opcode: int
     pc: int
@@ -53,7 +53,6 @@ class TraceEVM:
             if output_oracle.depth is None:
                 instruction = Instruction(
                     instruction_metadata.opcode,
-                    opcode_to_name(instruction_metadata.opcode, "UNKNOWN"),
                     instruction_metadata.pc,
                     self.env.current_step_index,
                     self.env.current_call_context,
@@ -185,8 +184,9 @@ class TraceEVM:
         storage_accesses: StorageAccesses,
         instruction: Instruction,
     ):
+        memory = self.env.memory
         for mem_access in storage_accesses.memory:
-            self.env.memory.check_expansion(
+            memory.check_expansion(
                 mem_access.offset, len(mem_access.value), instruction.step_index
             )
 
@@ -195,16 +195,17 @@ class TraceEVM:
         storage_writes: StorageWrites,
         instruction: Instruction,
     ):
+        # the writes do not change the call context, thus neither stack nor memory
+        stack = self.env.stack
+        memory = self.env.memory
         for _ in storage_writes.stack_pops:
-            self.env.stack.pop()
+            stack.pop()
         for stack_push in storage_writes.stack_pushes:
-            self.env.stack.push(stack_push.value)
+            stack.push(stack_push.value)
         for stack_set in storage_writes.stack_sets:
-            self.env.stack.set(stack_set.index, stack_set.value)
+            stack.set(stack_set.index, stack_set.value)
         for mem_write in storage_writes.memory:
-            self.env.memory.set(
-                mem_write.offset, mem_write.value, instruction.step_index
-            )
+            memory.set(mem_write.offset, mem_write.value, instruction.step_index)
         if storage_writes.return_data:
             self.env.current_call_context.return_data = storage_writes.return_data.value
 
@@ -236,7 +237,7 @@ class TraceEVM:
             )
 
     def _verify_stack(self, instruction: Instruction, stack_oracle: list[HexString]):
-        stack_int = [x.get_hexstring().as_int() for x in self.env.stack.get_all()]
+        stack_int = [x.as_int() for x in self.env.stack.get_all_hexstrings()]
         stack_oracle_int = [x.as_int() for x in stack_oracle]
 
         if stack_int != stack_oracle_int:
@@ -264,20 +265,18 @@ def parse_instruction(
     output_oracle: InstructionOutputOracle,
 ) -> Instruction:
     opcode = instruction_metadata.opcode
-    name = opcode_to_name(opcode) or "UNKNOWN"
-
-    cls = get_instruction_class(opcode) or Instruction
+    cls = _INSTRUCTIONS_TABLE[opcode] if 0 <= opcode < 256 else Instruction
 
     try:
-        flow = cls.parse_flow(env, output_oracle)
+        flow = cls.flow_spec_compute(env, output_oracle)
     except Exception as e:
+        name = opcode_to_name(opcode, "UNKNOWN")
         raise Exception(
             f"Could not parse {name} flow at step {env.current_step_index}: {instruction_metadata}"
         ) from e
 
     return cls(
         opcode,
-        name,
         instruction_metadata.pc,
         env.current_step_index,
         env.current_call_context,
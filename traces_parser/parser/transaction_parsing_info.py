@@ -6,7 +6,7 @@ from traces_parser.parser.instructions.instruction import Instruction
 from traces_parser.datatypes.hexstring import HexString
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionParsingInfo:
     sender: HexString
     to: HexString
@@ -15,7 +15,7 @@ class TransactionParsingInfo:
     verify_storages: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedTransaction:
     instructions: Sequence[Instruction]
     call_tree: CallTree
@@ -158,6 +158,9 @@ _OPCODE_TO_NAME = dict(
 
 _NAME_TO_OPCODE = dict((name, opcode) for opcode, name in _OPCODE_TO_NAME.items())
 
+# names indexed by opcode, with "" for undefined opcodes
+OPCODE_NAMES: tuple[str, ...] = tuple(_OPCODE_TO_NAME.get(i, "") for i in range(256))
+
 
 @overload
 def opcode_to_name(opcode: int) -> str | None: ...
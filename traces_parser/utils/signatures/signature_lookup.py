@@ -7,3 +7,24 @@ class SignatureLookup(ABC):
     @abstractmethod
     def lookup_by_hex(self, signature_hex: HexString) -> str | None:
         pass
+
+
+class CachedSignatureLookup(SignatureLookup):
+    """Remember the signatures found by another lookup.
+
+    Only found signatures are cached, such that a failed lookup
+    (eg the registry not being reachable) is retried the next time."""
+
+    def __init__(self, lookup: SignatureLookup) -> None:
+        super().__init__()
+        self._lookup = lookup
+        self._signatures: dict[str, str] = {}
+
+    def lookup_by_hex(self, signature_hex: HexString) -> str | None:
+        key = signature_hex.without_prefix()
+        signature = self._signatures.get(key)
+        if signature is None:
+            signature = self._lookup.lookup_by_hex(signature_hex)
+            if signature is not None:
+                self._signatures[key] = signature
+        return signature